@@ -3,7 +3,9 @@ Simplified analysis endpoints
 """
 from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy.sql import func
 import structlog
 import aiofiles
 import os
@@ -12,17 +14,50 @@ from app.core.database import get_db
 from app.core.security import get_current_user
 from app.models.user import User
 from app.models.session import AnalysisSession
-from app.services.depression_classifier import DepressionClassifier
+from app.services.depression_classifier import DepressionClassifier, get_depression_classifier
 from app.core.config import settings
 
 logger = structlog.get_logger(__name__)
 router = APIRouter()
 
+_DEPRESSION_STAGES = {
+    'not_depressed': 'No Depression',
+    'mild': 'Mild Depression - Early Stage',
+    'moderate': 'Moderate Depression - Intervention Needed',
+    'severe': 'Severe Depression - Immediate Support Required'
+}
+
+_RECOMMENDATIONS = {
+    'not_depressed': (
+        "Continue with healthy habits and regular self-care",
+        "Practice gratitude and maintain social connections",
+        "Keep up with regular exercise and good sleep"
+    ),
+    'mild': (
+        "Try daily meditation or mindfulness exercises",
+        "Increase physical activity and outdoor time",
+        "Consider talking to a counselor if symptoms persist"
+    ),
+    'moderate': (
+        "Schedule an appointment with a mental health professional",
+        "Practice stress management techniques daily",
+        "Reach out to trusted friends or family for support"
+    ),
+    'severe': (
+        "Seek immediate professional help from a psychiatrist or therapist",
+        "Contact crisis support if having thoughts of self-harm",
+        "Consider intensive treatment options with professional guidance"
+    )
+}
+
+_DEFAULT_RECOMMENDATIONS = ("Consult with a healthcare professional",)
+
 @router.post("/text")
 async def analyze_text(
     text: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    classifier: DepressionClassifier = Depends(get_depression_classifier)
 ) -> Any:
     """Analyze text for depression indicators"""
     
@@ -33,35 +68,30 @@ async def analyze_text(
         )
     
     try:
-        # Create session
+        # Analyze text (blocking provider calls run in the threadpool)
+        result = await run_in_threadpool(classifier.analyze_text, text)
+        
+        # Store the completed session in a single commit
         session = AnalysisSession(
             user_id=current_user.id,
             text_input=text,
-            status="processing"
+            depression_result=result['depression_level'],
+            confidence_score=result['confidence'],
+            detailed_analysis=result,
+            status="completed",
+            completed_at=func.now()
         )
         db.add(session)
-        db.commit()
-        db.refresh(session)
-        
-        # Analyze text
-        classifier = DepressionClassifier()
-        result = classifier.analyze_text(text)
-        
-        # Update session with results
-        session.depression_result = result['depression_level']
-        session.confidence_score = result['confidence']
-        session.detailed_analysis = result
-        session.status = "completed"
-        session.completed_at = func.now()
-        
+        db.flush()
+        session_id = session.id
         db.commit()
         
         logger.info("Text analysis completed", 
-                   session_id=session.id,
+                   session_id=session_id,
                    result=result['depression_level'])
         
         return {
-            'session_id': session.id,
+            'session_id': session_id,
             'depression_level': result['depression_level'],
             'confidence': result['confidence'],
             'explanation': result['explanation'],
@@ -83,7 +113,16 @@ async def get_user_sessions(
 ) -> Any:
     """Get user's analysis history"""
     
-    sessions = db.query(AnalysisSession).filter(
+    # Only the listed columns; skips the text and detailed_analysis JSON blobs
+    sessions = db.query(AnalysisSession).options(
+        load_only(
+            AnalysisSession.id,
+            AnalysisSession.depression_result,
+            AnalysisSession.confidence_score,
+            AnalysisSession.created_at,
+            AnalysisSession.status
+        )
+    ).filter(
         AnalysisSession.user_id == current_user.id
     ).order_by(AnalysisSession.created_at.desc()).limit(20).all()
     
@@ -102,38 +141,8 @@ async def get_user_sessions(
 
 def _get_depression_stage(level: str) -> str:
     """Convert level to stage description"""
-    stages = {
-        'not_depressed': 'No Depression',
-        'mild': 'Mild Depression - Early Stage',
-        'moderate': 'Moderate Depression - Intervention Needed',
-        'severe': 'Severe Depression - Immediate Support Required'
-    }
-    return stages.get(level, 'Unknown')
+    return _DEPRESSION_STAGES.get(level, 'Unknown')
 
 def _get_recommendations(level: str) -> list:
     """Get recommendations based on depression level"""
-    
-    recommendations = {
-        'not_depressed': [
-            "Continue with healthy habits and regular self-care",
-            "Practice gratitude and maintain social connections",
-            "Keep up with regular exercise and good sleep"
-        ],
-        'mild': [
-            "Try daily meditation or mindfulness exercises",
-            "Increase physical activity and outdoor time",
-            "Consider talking to a counselor if symptoms persist"
-        ],
-        'moderate': [
-            "Schedule an appointment with a mental health professional",
-            "Practice stress management techniques daily",
-            "Reach out to trusted friends or family for support"
-        ],
-        'severe': [
-            "Seek immediate professional help from a psychiatrist or therapist",
-            "Contact crisis support if having thoughts of self-harm",
-            "Consider intensive treatment options with professional guidance"
-        ]
-    }
-    
-    return recommendations.get(level, ["Consult with a healthcare professional"])
\ No newline at end of file
+    return list(_RECOMMENDATIONS.get(level, _DEFAULT_RECOMMENDATIONS))
\ No newline at end of file
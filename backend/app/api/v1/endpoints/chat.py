@@ -3,6 +3,7 @@ Simplified chat endpoints
 """
 from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 import structlog
 
@@ -10,7 +11,7 @@ from app.core.database import get_db
 from app.core.security import get_current_user
 from app.models.user import User
 from app.models.session import AnalysisSession
-from app.services.chatbot import HealthChatbot
+from app.services.chatbot import HealthChatbot, get_chatbot
 
 logger = structlog.get_logger(__name__)
 router = APIRouter()
@@ -19,7 +20,8 @@ router = APIRouter()
 async def send_message(
     message: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    chatbot: HealthChatbot = Depends(get_chatbot)
 ) -> Any:
     """Send message to health chatbot"""
     
@@ -31,10 +33,15 @@ async def send_message(
     
     try:
         # Get user context from recent analysis
-        recent_session = db.query(AnalysisSession).filter(
-            AnalysisSession.user_id == current_user.id,
-            AnalysisSession.status == "completed"
-        ).order_by(AnalysisSession.created_at.desc()).first()
+        recent_session = db.execute(
+            select(
+                AnalysisSession.depression_result,
+                AnalysisSession.confidence_score
+            ).where(
+                AnalysisSession.user_id == current_user.id,
+                AnalysisSession.status == "completed"
+            ).order_by(AnalysisSession.created_at.desc()).limit(1)
+        ).first()
         
         user_context = None
         if recent_session:
@@ -46,7 +53,6 @@ async def send_message(
             }
         
         # Process message
-        chatbot = HealthChatbot()
         response = await chatbot.chat(message, user_context)
         
         return response
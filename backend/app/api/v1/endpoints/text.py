@@ -1,7 +1,8 @@
 """
 Text analysis endpoints for depression severity assessment
 """
-from typing import Any
+from datetime import datetime
+from typing import Any, Dict, List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 import structlog
@@ -16,6 +17,51 @@ from app.services.ml.text_classifier import TextClassifier
 logger = structlog.get_logger(__name__)
 router = APIRouter()
 
+# Static recommendation entries, shared across requests
+_CRISIS_RECOMMENDATIONS = (
+    {
+        'title': 'Immediate Support',
+        'description': 'Please reach out to a mental health professional or crisis hotline immediately',
+        'urgency': 'critical',
+        'action': 'seek_help'
+    },
+    {
+        'title': 'Emergency Resources',
+        'description': 'Call 988 (US) or your local emergency services',
+        'urgency': 'critical',
+        'action': 'emergency'
+    }
+)
+
+_DEPRESSION_RECOMMENDATIONS = {
+    'severe': {
+        'title': 'Professional Support',
+        'description': 'Consider scheduling an appointment with a mental health professional',
+        'urgency': 'high',
+        'action': 'find_providers'
+    },
+    'moderate': {
+        'title': 'Self-Care Focus',
+        'description': 'Try daily mood tracking and gentle self-care activities',
+        'urgency': 'medium',
+        'action': 'self_care'
+    }
+}
+
+_HIGH_ANXIETY_RECOMMENDATION = {
+    'title': 'Breathing Exercise',
+    'description': '5-minute box breathing can help reduce immediate anxiety',
+    'urgency': 'medium',
+    'action': 'breathing_exercise'
+}
+
+_WELLNESS_RECOMMENDATION = {
+    'title': 'Mindful Check-in',
+    'description': 'Continue regular self-reflection and maintain healthy habits',
+    'urgency': 'low',
+    'action': 'maintain_wellness'
+}
+
 @router.post("/analyze", response_model=TextAnalysisResponse)
 async def analyze_text(
     request: TextAnalysisRequest,
@@ -139,60 +185,25 @@ async def get_text_analysis_history(
 def _generate_text_recommendations(analysis_results: Dict[str, Any]) -> List[Dict[str, str]]:
     """Generate immediate recommendations based on text analysis"""
     
-    recommendations = []
-    
     # Safety-first recommendations
     if analysis_results['safety_flags']['has_crisis_indicators']:
-        recommendations.extend([
-            {
-                'title': 'Immediate Support',
-                'description': 'Please reach out to a mental health professional or crisis hotline immediately',
-                'urgency': 'critical',
-                'action': 'seek_help'
-            },
-            {
-                'title': 'Emergency Resources',
-                'description': 'Call 988 (US) or your local emergency services',
-                'urgency': 'critical',
-                'action': 'emergency'
-            }
-        ])
-        return recommendations
+        return list(_CRISIS_RECOMMENDATIONS)
+    
+    recommendations = []
     
     # Depression-based recommendations
     depression_label = analysis_results['depression']['label']
-    if depression_label == 'severe':
-        recommendations.append({
-            'title': 'Professional Support',
-            'description': 'Consider scheduling an appointment with a mental health professional',
-            'urgency': 'high',
-            'action': 'find_providers'
-        })
-    elif depression_label == 'moderate':
-        recommendations.append({
-            'title': 'Self-Care Focus',
-            'description': 'Try daily mood tracking and gentle self-care activities',
-            'urgency': 'medium',
-            'action': 'self_care'
-        })
+    depression_recommendation = _DEPRESSION_RECOMMENDATIONS.get(depression_label)
+    if depression_recommendation:
+        recommendations.append(depression_recommendation)
     
     # Anxiety-based recommendations
     anxiety_level = analysis_results['anxiety_keywords']['level']
     if anxiety_level == 'high':
-        recommendations.append({
-            'title': 'Breathing Exercise',
-            'description': '5-minute box breathing can help reduce immediate anxiety',
-            'urgency': 'medium',
-            'action': 'breathing_exercise'
-        })
+        recommendations.append(_HIGH_ANXIETY_RECOMMENDATION)
     
     # General wellness
     if not recommendations:
-        recommendations.append({
-            'title': 'Mindful Check-in',
-            'description': 'Continue regular self-reflection and maintain healthy habits',
-            'urgency': 'low',
-            'action': 'maintain_wellness'
-        })
+        recommendations.append(_WELLNESS_RECOMMENDATION)
     
     return recommendations
\ No newline at end of file
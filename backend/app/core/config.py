@@ -26,6 +26,7 @@ class Settings(BaseSettings):
     COHERE_API_KEY: Optional[str] = Field(default=None, env="COHERE_API_KEY")
     PINECONE_API_KEY: Optional[str] = Field(default=None, env="PINECONE_API_KEY")
     PINECONE_ENVIRONMENT: Optional[str] = Field(default=None, env="PINECONE_ENVIRONMENT")
+    CHAT_RESPONSE_TIMEOUT: float = Field(default=10.0, env="CHAT_RESPONSE_TIMEOUT")  # seconds, per provider call
     
     # File Storage (Local)
     UPLOAD_DIR: str = Field(default="uploads", env="UPLOAD_DIR")
@@ -36,6 +37,9 @@ class Settings(BaseSettings):
     
     # Model paths
     MODEL_DIR: str = Field(default="models", env="MODEL_DIR")
+    
+    # Text analysis result cache (number of entries)
+    ANALYSIS_CACHE_SIZE: int = Field(default=4096, env="ANALYSIS_CACHE_SIZE")
 
     class Config:
         env_file = ".env"
@@ -57,11 +57,11 @@ async def startup_event():
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log requests"""
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     response = await call_next(request)
     
-    process_time = time.time() - start_time
+    process_time = time.perf_counter() - start_time
     logger.info(
         "Request processed",
         method=request.method,
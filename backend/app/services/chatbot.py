@@ -1,6 +1,9 @@
 """
 Simple chatbot using free AI APIs
 """
+import asyncio
+import re
+from functools import lru_cache
 import google.generativeai as genai
 import cohere
 from typing import Dict, Any, Optional
@@ -10,6 +13,21 @@ from app.core.config import settings
 
 logger = structlog.get_logger(__name__)
 
+# Crisis keywords
+CRISIS_KEYWORDS = (
+    'suicide', 'kill myself', 'end my life', 'hurt myself', 'self harm'
+)
+CRISIS_PATTERN = re.compile('|'.join(map(re.escape, CRISIS_KEYWORDS)))
+
+SYSTEM_PROMPT = """You are a supportive mental health assistant. Provide helpful, empathetic responses about mental wellness, but always remind users that you're not a replacement for professional medical care. 
+
+If someone mentions self-harm or suicide, immediately provide crisis resources:
+- National Suicide Prevention Lifeline: 988
+- Crisis Text Line: Text HOME to 741741
+- Emergency Services: 911
+
+Keep responses supportive, informative, and under 200 words."""
+
 class HealthChatbot:
     """Simple health chatbot using free APIs"""
     
@@ -23,30 +41,23 @@ class HealthChatbot:
             self.gemini_model = genai.GenerativeModel('gemini-pro')
         
         if settings.COHERE_API_KEY:
-            self.cohere_client = cohere.Client(settings.COHERE_API_KEY)
-        
-        # Crisis keywords
-        self.crisis_keywords = [
-            'suicide', 'kill myself', 'end my life', 'hurt myself', 'self harm'
-        ]
+            self.cohere_client = cohere.Client(
+                settings.COHERE_API_KEY,
+                timeout=settings.CHAT_RESPONSE_TIMEOUT
+            )
         
-        self.system_prompt = """You are a supportive mental health assistant. Provide helpful, empathetic responses about mental wellness, but always remind users that you're not a replacement for professional medical care. 
-
-If someone mentions self-harm or suicide, immediately provide crisis resources:
-- National Suicide Prevention Lifeline: 988
-- Crisis Text Line: Text HOME to 741741
-- Emergency Services: 911
-
-Keep responses supportive, informative, and under 200 words."""
+        self.crisis_keywords = CRISIS_KEYWORDS
+        self.crisis_pattern = CRISIS_PATTERN
+        self.system_prompt = SYSTEM_PROMPT
     
     async def chat(self, message: str, user_context: Optional[Dict] = None) -> Dict[str, Any]:
         """Process chat message"""
         
-        logger.info("Processing chat message", message_length=len(message))
+        logger.debug("Processing chat message", message_length=len(message))
         
         # Check for crisis indicators
         message_lower = message.lower()
-        crisis_detected = any(keyword in message_lower for keyword in self.crisis_keywords)
+        crisis_detected = self.crisis_pattern.search(message_lower) is not None
         
         if crisis_detected:
             return {
@@ -76,30 +87,46 @@ Keep responses supportive, informative, and under 200 words."""
         
         # Build context-aware prompt
         context_info = ""
-        if context and context.get('recent_analysis'):
-            level = context['recent_analysis'].get('depression_level', 'unknown')
+        recent_analysis = context.get('recent_analysis') if context else None
+        if recent_analysis:
+            level = recent_analysis.get('depression_level', 'unknown')
             context_info = f"\nUser's recent analysis shows {level} depression level. "
         
         full_prompt = f"{self.system_prompt}\n{context_info}\nUser: {message}\nAssistant:"
         
+        # Provider SDKs are blocking; run them off the event loop, each with its
+        # own timeout so a slow provider falls through to the next one
+        timeout = settings.CHAT_RESPONSE_TIMEOUT
+        
         # Try Gemini first
         if self.gemini_model:
             try:
-                response = self.gemini_model.generate_content(full_prompt)
+                response = await asyncio.wait_for(
+                    asyncio.to_thread(self.gemini_model.generate_content, full_prompt),
+                    timeout=timeout
+                )
                 return response.text.strip()
+            except asyncio.TimeoutError:
+                logger.warning("Gemini API timed out", timeout=timeout)
             except Exception as e:
                 logger.warning("Gemini API failed", error=str(e))
         
         # Try Cohere
         if self.cohere_client:
             try:
-                response = self.cohere_client.generate(
-                    model='command-light',
-                    prompt=full_prompt,
-                    max_tokens=200,
-                    temperature=0.7
+                response = await asyncio.wait_for(
+                    asyncio.to_thread(
+                        self.cohere_client.generate,
+                        model='command-light',
+                        prompt=full_prompt,
+                        max_tokens=200,
+                        temperature=0.7
+                    ),
+                    timeout=timeout
                 )
                 return response.generations[0].text.strip()
+            except asyncio.TimeoutError:
+                logger.warning("Cohere API timed out", timeout=timeout)
             except Exception as e:
                 logger.warning("Cohere API failed", error=str(e))
         
@@ -144,4 +171,9 @@ If these feelings persist for more than two weeks, please consider professional
 
 I can help you understand coping strategies or discuss your feelings. What specific area would you like to explore?
 
-Remember, I'm not a replacement for professional mental health care."""
\ No newline at end of file
+Remember, I'm not a replacement for professional mental health care."""
+
+@lru_cache(maxsize=1)
+def get_chatbot() -> HealthChatbot:
+    """Shared chatbot instance, created once per process"""
+    return HealthChatbot()
@@ -3,67 +3,146 @@ Transformer-based depression classification using free APIs
 """
 import google.generativeai as genai
 import cohere
+import ahocorasick
 from typing import Dict, Any, Optional
 import structlog
+import copy
+import hashlib
 import re
+import threading
+from collections import OrderedDict
+from functools import cached_property, lru_cache
 
 from app.core.config import settings
 
 logger = structlog.get_logger(__name__)
 
+# Expected AI classification format: LEVEL|CONFIDENCE
+AI_RESPONSE_PATTERN = re.compile(r'(not_depressed|mild|moderate|severe)\|([0-9.]+)')
+
+# LRU of analysis results keyed by a digest of the normalized text
+_result_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+# Explanation text per depression level (shared, built once at import)
+LEVEL_EXPLANATIONS = {
+    'not_depressed': "The text shows positive language patterns with no significant depression indicators.",
+    'mild': "Some stress or temporary low mood indicators detected. This is common and often manageable with self-care.",
+    'moderate': "Clear depression symptoms are present that may be affecting daily functioning. Consider professional support.",
+    'severe': "Significant depression indicators detected. Please reach out to a mental health professional immediately."
+}
+
+# Depression indicators for rule-based fallback
+DEPRESSION_KEYWORDS = {
+    'severe': (
+        'hopeless', 'worthless', 'suicidal', 'kill myself', 'end it all',
+        'pointless', 'empty', 'numb', 'trapped', 'burden'
+    ),
+    'moderate': (
+        'depressed', 'sad', 'down', 'low', 'blue', 'unhappy',
+        'tired', 'exhausted', 'unmotivated', 'lonely', 'isolated'
+    ),
+    'mild': (
+        'stressed', 'worried', 'anxious', 'overwhelmed', 'frustrated',
+        'disappointed', 'discouraged', 'upset'
+    )
+}
+
+POSITIVE_INDICATORS = (
+    'happy', 'good', 'great', 'excellent', 'wonderful', 'amazing',
+    'positive', 'optimistic', 'hopeful', 'grateful', 'blessed'
+)
+
+def _build_keyword_automaton() -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton mapping each keyword to its category"""
+    
+    automaton = ahocorasick.Automaton()
+    
+    for level, keywords in DEPRESSION_KEYWORDS.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, level)
+    
+    for keyword in POSITIVE_INDICATORS:
+        automaton.add_word(keyword, 'positive')
+    
+    automaton.make_automaton()
+    return automaton
+
+# All keyword categories compiled once for single-pass scanning
+KEYWORD_AUTOMATON = _build_keyword_automaton()
+
 class DepressionClassifier:
     """Depression classification using transformer models and free APIs"""
     
     def __init__(self):
-        # Initialize free API clients
-        self.gemini_model = None
-        self.cohere_client = None
+        # Rule-based fallback lexicon, shared across instances
+        self.depression_keywords = DEPRESSION_KEYWORDS
+        self.positive_indicators = POSITIVE_INDICATORS
+        self.keyword_automaton = KEYWORD_AUTOMATON
+    
+    @cached_property
+    def gemini_model(self) -> Optional[Any]:
+        """Gemini client, created on first AI analysis"""
+        
+        if not settings.GEMINI_API_KEY:
+            return None
         
-        if settings.GEMINI_API_KEY:
+        try:
             genai.configure(api_key=settings.GEMINI_API_KEY)
-            self.gemini_model = genai.GenerativeModel('gemini-pro')
-        
-        if settings.COHERE_API_KEY:
-            self.cohere_client = cohere.Client(settings.COHERE_API_KEY)
-        
-        # Depression indicators for rule-based fallback
-        self.depression_keywords = {
-            'severe': [
-                'hopeless', 'worthless', 'suicidal', 'kill myself', 'end it all',
-                'pointless', 'empty', 'numb', 'trapped', 'burden'
-            ],
-            'moderate': [
-                'depressed', 'sad', 'down', 'low', 'blue', 'unhappy',
-                'tired', 'exhausted', 'unmotivated', 'lonely', 'isolated'
-            ],
-            'mild': [
-                'stressed', 'worried', 'anxious', 'overwhelmed', 'frustrated',
-                'disappointed', 'discouraged', 'upset'
-            ]
-        }
+            return genai.GenerativeModel('gemini-pro')
+        except Exception as e:
+            logger.warning("Gemini client initialization failed", error=str(e))
+            return None
+    
+    @cached_property
+    def cohere_client(self) -> Optional[Any]:
+        """Cohere client, created on first AI analysis"""
         
-        self.positive_indicators = [
-            'happy', 'good', 'great', 'excellent', 'wonderful', 'amazing',
-            'positive', 'optimistic', 'hopeful', 'grateful', 'blessed'
-        ]
+        if not settings.COHERE_API_KEY:
+            return None
+        
+        try:
+            return cohere.Client(settings.COHERE_API_KEY)
+        except Exception as e:
+            logger.warning("Cohere client initialization failed", error=str(e))
+            return None
     
     def analyze_text(self, text: str) -> Dict[str, Any]:
         """Analyze text for depression indicators"""
         
-        logger.info("Analyzing text for depression", text_length=len(text))
+        logger.debug("Analyzing text for depression", text_length=len(text))
         
-        try:
-            # Try AI-powered analysis first
-            ai_result = self._analyze_with_ai(text)
-            if ai_result:
-                return ai_result
-            
-            # Fallback to rule-based analysis
-            return self._analyze_with_rules(text)
-            
-        except Exception as e:
-            logger.error("Text analysis failed", error=str(e))
-            return self._analyze_with_rules(text)
+        # Repeated submissions of the same text reuse the previous result
+        cache_key = hashlib.blake2b(text.strip().lower().encode(), digest_size=16).digest()
+        with _result_cache_lock:
+            cached = _result_cache.get(cache_key)
+            if cached is not None:
+                _result_cache.move_to_end(cache_key)
+                return copy.deepcopy(cached)
+        
+        result = self._analyze(text)
+        
+        # A rule-based result while a provider is configured means the provider
+        # failed; don't pin that fallback for the text once the provider recovers
+        provider_configured = bool(settings.GEMINI_API_KEY or settings.COHERE_API_KEY)
+        if result['analysis_method'] == 'ai' or not provider_configured:
+            with _result_cache_lock:
+                _result_cache[cache_key] = copy.deepcopy(result)
+                if len(_result_cache) > settings.ANALYSIS_CACHE_SIZE:
+                    _result_cache.popitem(last=False)
+        
+        return result
+    
+    def _analyze(self, text: str) -> Dict[str, Any]:
+        """Run AI analysis with rule-based fallback"""
+        
+        # Try AI-powered analysis first; provider errors are handled per API
+        ai_result = self._analyze_with_ai(text)
+        if ai_result:
+            return ai_result
+        
+        # Fallback to rule-based analysis
+        return self._analyze_with_rules(text)
     
     def _analyze_with_ai(self, text: str) -> Optional[Dict[str, Any]]:
         """Use AI APIs for analysis"""
@@ -114,7 +193,7 @@ class DepressionClassifier:
         
         try:
             # Look for pattern: level|confidence
-            match = re.search(r'(not_depressed|mild|moderate|severe)\|([0-9.]+)', response.lower())
+            match = AI_RESPONSE_PATTERN.search(response.lower())
             
             if match:
                 level = match.group(1)
@@ -139,12 +218,9 @@ class DepressionClassifier:
         # Count indicators by severity
         scores = {'severe': 0, 'moderate': 0, 'mild': 0, 'positive': 0}
         
-        for level, keywords in self.depression_keywords.items():
-            for keyword in keywords:
-                scores[level] += text_lower.count(keyword)
-        
-        for keyword in self.positive_indicators:
-            scores['positive'] += text_lower.count(keyword)
+        # One scan reports every (possibly overlapping) keyword occurrence
+        for _, level in self.keyword_automaton.iter(text_lower):
+            scores[level] += 1
         
         # Determine classification
         if scores['severe'] > 0:
@@ -171,14 +247,12 @@ class DepressionClassifier:
     def _generate_explanation(self, level: str, confidence: float, text: str) -> str:
         """Generate human-readable explanation"""
         
-        explanations = {
-            'not_depressed': "The text shows positive language patterns with no significant depression indicators.",
-            'mild': "Some stress or temporary low mood indicators detected. This is common and often manageable with self-care.",
-            'moderate': "Clear depression symptoms are present that may be affecting daily functioning. Consider professional support.",
-            'severe': "Significant depression indicators detected. Please reach out to a mental health professional immediately."
-        }
-        
-        base_explanation = explanations.get(level, "Analysis completed.")
+        base_explanation = LEVEL_EXPLANATIONS.get(level, "Analysis completed.")
         confidence_text = f" (Confidence: {confidence:.0%})"
         
-        return base_explanation + confidence_text
\ No newline at end of file
+        return base_explanation + confidence_text
+
+@lru_cache(maxsize=1)
+def get_depression_classifier() -> DepressionClassifier:
+    """Shared classifier instance, created once per process"""
+    return DepressionClassifier()
@@ -0,0 +1,60 @@
+"""
+Chatbot tests
+"""
+import time
+import pytest
+from types import SimpleNamespace
+from app.core.config import settings
+from app.services.chatbot import HealthChatbot
+
+class SlowGemini:
+    """Gemini stub that answers only after a delay"""
+
+    def __init__(self, delay):
+        self.delay = delay
+
+    def generate_content(self, prompt):
+        time.sleep(self.delay)
+        return SimpleNamespace(text="gemini reply")
+
+class StubCohere:
+    """Cohere stub that answers immediately"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate(self, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(generations=[SimpleNamespace(text="cohere reply")])
+
+@pytest.fixture
+def chatbot(monkeypatch):
+    """Chatbot with no real provider clients"""
+    monkeypatch.setattr(settings, 'GEMINI_API_KEY', None)
+    monkeypatch.setattr(settings, 'COHERE_API_KEY', None)
+    monkeypatch.setattr(settings, 'CHAT_RESPONSE_TIMEOUT', 0.05)
+    return HealthChatbot()
+
+@pytest.mark.asyncio
+async def test_slow_provider_falls_through_to_next(chatbot):
+    """Test that a Gemini timeout moves on to Cohere instead of the fallback"""
+    chatbot.gemini_model = SlowGemini(delay=0.5)
+    chatbot.cohere_client = StubCohere()
+
+    result = await chatbot.chat("How can I sleep better?")
+
+    assert result['response'] == "cohere reply"
+    assert chatbot.cohere_client.calls == 1
+
+@pytest.mark.asyncio
+async def test_all_providers_slow_uses_fallback(chatbot):
+    """Test the rule-based fallback when every provider times out"""
+    chatbot.gemini_model = SlowGemini(delay=0.5)
+
+    result = await chatbot.chat("I feel sad today")
+
+    assert "difficult time" in result['response']
+    assert result['crisis_detected'] is False
+
+if __name__ == "__main__":
+    pytest.main([__file__])